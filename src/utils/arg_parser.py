@@ -0,0 +1,112 @@
+"""Minimal CLI argument parsing without the argparse import cost.
+
+argparse drags in gettext and builds a full parser object on every
+startup, which dominates cold-start time when the CLI is reinvoked in a
+loop (CI fuzzing, orchestration). This module parses sys.argv by hand
+into a frozen dataclass and only falls back to argparse for --help,
+where the formatting machinery is actually worth paying for.
+"""
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+_FLAG_OPTIONS = {"--http2", "--pretty", "--debug"}
+_VALUE_OPTIONS = {"--usernames", "--passwords", "--delay", "--max-workers", "--output"}
+_LIST_OPTIONS = {"--invalid-user-keywords", "--login-fail-indicators", "--success-redirect-keywords"}
+
+
+@dataclass(frozen=True)
+class Args:
+    url: str
+    usernames: str = "usernames.txt"
+    passwords: str = "passwords.txt"
+    invalid_user_keywords: Tuple[str, ...] = ("invalid username", "user does not exist", "unknown user")
+    login_fail_indicators: Tuple[str, ...] = ("incorrect password", "login failed", "wrong password")
+    success_redirect_keywords: Tuple[str, ...] = ("wp-admin",)
+    delay: float = 0.0
+    max_workers: int = 10
+    http2: bool = False
+    output: Optional[str] = None
+    pretty: bool = False
+    debug: bool = False
+
+
+# Parsed once per process; repeat callers get the cached object
+_ARGS: Optional[Args] = None
+
+
+def _build_argparse_parser():
+    """Full argparse parser, imported lazily: only --help and usage
+    errors ever reach it."""
+    import argparse
+    parser = argparse.ArgumentParser(description="WordPress user enumeration and brute-force scanner")
+    parser.add_argument("url", help="Base URL of the WordPress site")
+    parser.add_argument("--usernames", default="usernames.txt", help="Username wordlist file")
+    parser.add_argument("--passwords", default="passwords.txt", help="Password wordlist file")
+    parser.add_argument("--invalid-user-keywords", nargs="+", default=list(Args.__dataclass_fields__["invalid_user_keywords"].default))
+    parser.add_argument("--login-fail-indicators", nargs="+", default=list(Args.__dataclass_fields__["login_fail_indicators"].default))
+    parser.add_argument("--success-redirect-keywords", nargs="+", default=list(Args.__dataclass_fields__["success_redirect_keywords"].default))
+    parser.add_argument("--delay", type=float, default=0.0, help="Fixed delay between login attempts in seconds")
+    parser.add_argument("--max-workers", type=int, default=10, help="Concurrent requests for the brute-force phase")
+    parser.add_argument("--http2", action="store_true", help="Multiplex attempts over one HTTP/2 connection")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON printed to stdout")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    return parser
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> Args:
+    """Parse CLI arguments into a frozen Args, caching the result.
+
+    The fast path never touches argparse; --help (or a malformed
+    command line) falls through to it for proper usage output.
+    """
+    global _ARGS
+    if _ARGS is not None and argv is None:
+        return _ARGS
+
+    tokens = list(sys.argv[1:] if argv is None else argv)
+    if "-h" in tokens or "--help" in tokens:
+        _build_argparse_parser().parse_args(tokens)  # prints help and exits
+
+    values = {}
+    positional = []
+    i = 0
+    try:
+        while i < len(tokens):
+            token = tokens[i]
+            key = token[2:].replace("-", "_")
+            if token in _FLAG_OPTIONS:
+                values[key] = True
+            elif token in _VALUE_OPTIONS:
+                i += 1
+                values[key] = tokens[i]
+            elif token in _LIST_OPTIONS:
+                words = []
+                while i + 1 < len(tokens) and not tokens[i + 1].startswith("--"):
+                    i += 1
+                    words.append(tokens[i])
+                values[key] = tuple(words)
+            elif token.startswith("--"):
+                raise ValueError(f"unrecognized option {token}")
+            else:
+                positional.append(token)
+            i += 1
+        if len(positional) != 1:
+            raise ValueError("expected exactly one url argument")
+        if "delay" in values:
+            values["delay"] = float(values["delay"])
+        if "max_workers" in values:
+            values["max_workers"] = int(values["max_workers"])
+        args = Args(url=positional[0], **values)
+    except (ValueError, IndexError, TypeError):
+        # Malformed input: let argparse produce the canonical error
+        namespace = _build_argparse_parser().parse_args(tokens)
+        args = Args(**{
+            field: tuple(v) if isinstance(v := getattr(namespace, field), list) else v
+            for field in Args.__dataclass_fields__
+        })
+
+    if argv is None:
+        _ARGS = args
+    return args
@@ -0,0 +1,206 @@
+"""Wordlist file loading helpers."""
+import logging
+import mmap
+import os
+import stat as stat_module
+from array import array
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Refuse to ingest wordlists past this size unless the caller raises it
+DEFAULT_MAX_SIZE_MB = 100
+
+
+# One syscall per this many bytes; line splitting then happens in C on
+# the whole chunk at once
+_CHUNK_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=128)
+def _cached_stat(path: str) -> os.stat_result:
+    """One stat per path per process: multi-site scans and test loops
+    validate the same wordlists over and over, and the cache turns the
+    repeats into dict hits instead of syscalls."""
+    return os.stat(path)
+
+
+def check_file_size(path: str, max_size_mb: int = DEFAULT_MAX_SIZE_MB) -> float:
+    """Return the file size in MB, raising ValueError over the limit."""
+    size_mb = _cached_stat(path).st_size * (1.0 / 1048576)
+    if size_mb > max_size_mb:
+        raise ValueError(f"{path} is {size_mb:.1f} MB, over the {max_size_mb} MB limit")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("File size check passed: %s (%.2f MB)", path, size_mb)
+    return size_mb
+
+
+def validate_file_path(path: str) -> bool:
+    """True when path names an existing, readable regular file.
+
+    Existence, type, and readability all come out of the one (cached)
+    stat struct — the separate exists/access round trips this replaces
+    were each a full kernel transition for the same information.
+    """
+    try:
+        st = _cached_stat(path)
+    except OSError:
+        return False
+    if not stat_module.S_ISREG(st.st_mode):
+        return False
+    if st.st_uid == os.getuid():
+        return bool(st.st_mode & stat_module.S_IRUSR)
+    if st.st_gid in os.getgroups():
+        return bool(st.st_mode & stat_module.S_IRGRP)
+    return bool(st.st_mode & stat_module.S_IROTH)
+
+
+def stream_file(path: str, max_size_mb: int = DEFAULT_MAX_SIZE_MB) -> Iterator[str]:
+    """Yield non-empty stripped lines from a wordlist file.
+
+    Reads fixed 1 MiB chunks with os.read and splits each chunk on
+    newlines in one C-level bytes.split call, carrying the partial last
+    line over as a tail buffer. Compared to iterating a buffered text
+    file this trades one read/decode/strip per line for one of each per
+    megabyte, and memory stays bounded by the chunk size.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > max_size_mb * 1024 * 1024:
+            raise ValueError(f"{path} is {size} bytes, over the {max_size_mb} MB limit")
+        buf = b""
+        while chunk := os.read(fd, _CHUNK_SIZE):
+            *lines, buf = (buf + chunk).split(b"\n")
+            for line in lines:
+                line = line.strip()
+                if line:
+                    yield line.decode("utf-8", errors="replace")
+        buf = buf.strip()
+        if buf:
+            yield buf.decode("utf-8", errors="replace")
+    finally:
+        os.close(fd)
+
+
+def _load_chunked(path: str, max_size_mb: int, chunk_size: int) -> Iterator[List[str]]:
+    """Group stream_file output into chunk_size lists.
+
+    iter(callable, sentinel) over islice keeps the grouping loop inside
+    C — no per-element append or length check in bytecode — and ends
+    cleanly when islice comes back empty.
+    """
+    it = stream_file(path, max_size_mb)
+    return iter(lambda: list(islice(it, chunk_size)), [])
+
+
+def load_usernames(source, max_size_mb: int = DEFAULT_MAX_SIZE_MB) -> List[str]:
+    """Load a whole wordlist as a list of usernames.
+
+    source is a path, or any object with a read() method (io.StringIO,
+    an open file) — streams skip the open/stat round trip entirely.
+    One read and one C-level splitlines beat a per-line loop for the
+    typical CLI-sized list; callers working through huge lists should
+    use iter_usernames (or the chunked loaders) instead.
+    """
+    if hasattr(source, "read"):
+        raw = source.read()
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", errors="replace")
+        lines = raw.splitlines()
+    else:
+        size = os.stat(source).st_size
+        if size > max_size_mb * 1024 * 1024:
+            raise ValueError(
+                f"{source} is {size} bytes, over the {max_size_mb} MB limit")
+        with open(source, "rb") as f:
+            lines = f.read().decode("utf-8", errors="replace").splitlines()
+    return [s for line in lines if (s := line.strip())]
+
+
+def load_passwords(path: str, max_size_mb: int = DEFAULT_MAX_SIZE_MB) -> List[str]:
+    """Load a whole wordlist as a list of passwords."""
+    return load_usernames(path, max_size_mb)
+
+
+def iter_usernames(path: str, max_size_mb: int = DEFAULT_MAX_SIZE_MB) -> Iterator[str]:
+    """Generator twin of load_usernames: nothing is materialized, so a
+    brute-force loop can consume a multi-million-line list at constant
+    memory."""
+    yield from stream_file(path, max_size_mb)
+
+
+def mmap_usernames(path: str) -> Iterator[str]:
+    """Stream usernames from an mmap'd wordlist.
+
+    The map is walked with bytes.find on newlines, so the only Python
+    objects alive at any point are the current line and its slice — the
+    kernel pages the file in on demand and peak memory is independent of
+    wordlist size, unlike load_usernames' list (or even stream_file's
+    1 MiB chunk buffer).
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        start = 0
+        size = len(mm)
+        find = mm.find
+        while start < size:
+            end = find(b"\n", start)
+            if end == -1:
+                end = size
+            line = mm[start:end].strip()
+            if line:
+                yield line.decode("utf-8", errors="replace")
+            start = end + 1
+    finally:
+        mm.close()
+
+
+def load_usernames_chunked(path: str, max_size_mb: int = DEFAULT_MAX_SIZE_MB,
+                           chunk_size: int = 1000) -> Iterator[List[str]]:
+    """Yield usernames from a wordlist in chunks of chunk_size."""
+    return _load_chunked(path, max_size_mb, chunk_size)
+
+
+def load_passwords_chunked(path: str, max_size_mb: int = DEFAULT_MAX_SIZE_MB,
+                           chunk_size: int = 1000) -> Iterator[List[str]]:
+    """Yield passwords from a wordlist in chunks of chunk_size."""
+    return _load_chunked(path, max_size_mb, chunk_size)
+
+
+def index_wordlist(path: str) -> Tuple[mmap.mmap, array]:
+    """Build a newline offset index over an mmap'd wordlist.
+
+    Returns the map plus an int64 array of newline positions bracketed
+    by -1 and the file size, so line i spans newlines[i]+1 to
+    newlines[i+1], len(newlines) - 1 is the line count, and get_line is
+    O(1) — chunked retries and resumes can jump straight to a line
+    instead of re-iterating from the start. The scan is one pass of
+    mmap.find per newline, built once per wordlist. An empty file yields
+    (None, array of just the -1 sentinel), i.e. zero lines.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None, array("q", [-1])
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    newlines = array("q", [-1])
+    pos = mm.find(b"\n")
+    while pos != -1:
+        newlines.append(pos)
+        pos = mm.find(b"\n", pos + 1)
+    # Only bracket with the file size when the last line is
+    # unterminated; a trailing newline would otherwise index one
+    # phantom empty final line (same case SharedWordlist.create pops)
+    if newlines[-1] != len(mm) - 1:
+        newlines.append(len(mm))
+    return mm, newlines
+
+
+def get_line(mm: mmap.mmap, newlines: array, i: int) -> str:
+    """Random access into an index_wordlist result."""
+    return mm[newlines[i] + 1:newlines[i + 1]].strip().decode("utf-8", errors="replace")
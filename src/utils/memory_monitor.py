@@ -0,0 +1,56 @@
+"""Memory watchdog for long scans over large wordlists."""
+import logging
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryMonitor:
+    """Periodically checks process RSS against a limit.
+
+    The psutil.Process handle is created once in __init__ — its
+    constructor does the expensive pid bookkeeping, and reusing it makes
+    each check a single /proc read. The limit is pre-converted to bytes
+    so the hot path compares raw rss integers with no float math.
+    """
+
+    # Slotted: attribute loads in check_memory_usage skip the instance
+    # __dict__ lookup, which matters when it runs once per attempt
+    __slots__ = ("memory_limit_mb", "_limit_bytes", "check_interval",
+                 "_countdown", "initial_memory", "_process", "_dbg")
+
+    def __init__(self, memory_limit_mb: int = 500, check_interval: int = 100):
+        self.memory_limit_mb = memory_limit_mb
+        self._limit_bytes = memory_limit_mb * 1048576
+        self.check_interval = check_interval
+        self._countdown = check_interval
+        self._process = psutil.Process()
+        # Snapshotted once: scans do not reconfigure logging mid-run, and
+        # a cached bool is cheaper than isEnabledFor per sample
+        self._dbg = logger.isEnabledFor(logging.DEBUG)
+        self.initial_memory = self._get_memory_usage()
+
+    def _get_memory_usage(self) -> float:
+        """Current RSS in MB."""
+        return self._process.memory_info().rss * (1.0 / 1048576)
+
+    def check_memory_usage(self) -> bool:
+        """Count one operation; every check_interval calls, verify RSS is
+        under the limit. Returns False when the limit is exceeded."""
+        # Countdown instead of a modulo: the fast path that runs on
+        # every attempt is a decrement and a truth test, no division
+        self._countdown -= 1
+        if self._countdown:
+            return True
+        self._countdown = self.check_interval
+
+        rss = self._process.memory_info().rss
+        if rss > self._limit_bytes:
+            logger.warning("Memory limit exceeded: %.1f MB > %d MB",
+                           rss / 1048576, self.memory_limit_mb)
+            return False
+        if self._dbg:
+            logger.debug("Memory usage: %.1f MB (increase: %.1f MB)",
+                         rss / 1048576, rss / 1048576 - self.initial_memory)
+        return True
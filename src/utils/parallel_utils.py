@@ -0,0 +1,119 @@
+"""Helpers for running per-item work across a thread pool or event loop."""
+import asyncio
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Iterable, Iterator, List, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _dispatch(
+    executor: ThreadPoolExecutor,
+    items: Iterable[T],
+    process_func: Callable[[T], R],
+    max_workers: int
+) -> Iterator[R]:
+    """Windowed submission onto an existing executor.
+
+    At most 2 * max_workers futures exist at any moment, topped up as
+    earlier ones finish, so generators are consumed lazily and memory
+    stays constant no matter how long the input is. Results arrive in
+    completion order, not input order.
+    """
+    window = 2 * max_workers
+    it = iter(items)
+    pending = set()
+    exhausted = False
+    while pending or not exhausted:
+        while not exhausted and len(pending) < window:
+            try:
+                item = next(it)
+            except StopIteration:
+                exhausted = True
+                break
+            pending.add(executor.submit(process_func, item))
+        if not pending:
+            break
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+def process_in_parallel(
+    items: Iterable[T],
+    process_func: Callable[[T], R],
+    max_workers: int = 5
+) -> Iterator[R]:
+    """Apply process_func to each item on a thread pool, yielding results
+    as they complete. See _dispatch for the windowing behavior."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from _dispatch(executor, items, process_func, max_workers)
+
+
+def process_chunks_in_parallel(
+    chunk_generator: Iterable[Iterable[T]],
+    process_func: Callable[[T], R],
+    max_workers: int = 5
+) -> Iterator[R]:
+    """Process a stream of chunks (e.g. from load_usernames_chunked) on one
+    thread pool, yielding results as they complete.
+
+    The executor is created once around the whole chunk loop — spawning
+    and joining max_workers threads per chunk would pay pthread
+    create/join syscalls for every chunk of a large wordlist. Yielding
+    instead of accumulating keeps the pipeline streaming end to end:
+    file to chunk to worker to consumer, with memory bounded by the
+    chunk size rather than the wordlist size.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk in chunk_generator:
+            yield from _dispatch(executor, chunk, process_func, max_workers)
+
+
+async def process_in_parallel_async(
+    items: Iterable[T],
+    coro_func: Callable[[T], Awaitable[R]],
+    concurrency: int = 100
+) -> List[R]:
+    """Run coro_func over each item with at most `concurrency` in flight.
+
+    For network-bound work this replaces thread-per-request with a
+    single event loop multiplexing sockets, so the useful concurrency
+    ceiling is the semaphore, not thread count or stack memory.
+    Exceptions come back in the result list (return_exceptions=True)
+    instead of cancelling the remaining items.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def runner(item: T) -> R:
+        async with sem:
+            return await coro_func(item)
+
+    return await asyncio.gather(*[runner(item) for item in items],
+                                return_exceptions=True)
+
+
+def process_in_parallel_cpu(
+    items: Iterable[T],
+    process_func: Callable[[T], R],
+    max_workers: int = None
+) -> List[R]:
+    """Apply process_func across processes for CPU-bound work.
+
+    Threads share the GIL, so hashing or heavy regex work caps at one
+    core under process_in_parallel; this variant forks real workers and
+    defaults max_workers to the core count. process_func must be a
+    picklable top-level function. chunksize batches items per IPC round
+    trip so the pickle/unpickle overhead is amortized.
+    """
+    items = list(items)
+    if not items:
+        return []
+    max_workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(items) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(process_func, items, chunksize=chunksize))
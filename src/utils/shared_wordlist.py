@@ -0,0 +1,101 @@
+"""Share a loaded wordlist across worker processes.
+
+Multi-site scans and test runners fork workers that would each re-read
+and re-allocate the same usernames/passwords files. This module loads a
+wordlist into one multiprocessing.shared_memory block plus a packed
+line-offset index, so every worker indexes the same physical pages
+zero-copy instead of holding its own list of strings. Workers attach by
+name; only the creating process unlinks.
+"""
+import logging
+from array import array
+from multiprocessing import shared_memory
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+_OFFSET_FORMAT = "Q"  # 8-byte unsigned offsets, enough for any wordlist
+_OFFSET_SIZE = 8
+
+
+class SharedWordlist:
+    """Read-only view of a wordlist held in shared memory.
+
+    The index block stores the line count followed by count + 1 line
+    start offsets (the last is a sentinel at end-of-data), so get_line
+    is two offset loads and one slice — no scanning after creation.
+    """
+
+    def __init__(self, data_shm: shared_memory.SharedMemory,
+                 index_shm: shared_memory.SharedMemory, owner: bool):
+        self._data_shm = data_shm
+        self._index_shm = index_shm
+        self._owner = owner
+        self._count = int.from_bytes(index_shm.buf[:_OFFSET_SIZE], "little")
+        offsets = array(_OFFSET_FORMAT)
+        offsets.frombytes(bytes(
+            index_shm.buf[_OFFSET_SIZE:_OFFSET_SIZE * (self._count + 2)]))
+        self._offsets = offsets
+
+    @classmethod
+    def create(cls, path: str, name: str = None) -> "SharedWordlist":
+        """Load path into shared memory. The creator owns the blocks."""
+        with open(path, "rb") as f:
+            data = f.read()
+
+        # Line starts plus an end-of-data sentinel; a trailing newline
+        # would otherwise register as one empty final line
+        offsets = array(_OFFSET_FORMAT, [0])
+        pos = data.find(b"\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = data.find(b"\n", pos + 1)
+        if offsets[-1] == len(data):
+            offsets.pop()
+        offsets.append(len(data))
+        count = len(offsets) - 1
+
+        data_shm = shared_memory.SharedMemory(
+            create=True, size=max(1, len(data)), name=name)
+        data_shm.buf[:len(data)] = data
+        index_bytes = count.to_bytes(_OFFSET_SIZE, "little") + offsets.tobytes()
+        index_shm = shared_memory.SharedMemory(
+            create=True, size=len(index_bytes),
+            name=f"{name}_idx" if name else None)
+        index_shm.buf[:len(index_bytes)] = index_bytes
+        logger.debug("Shared wordlist %s: %d lines, %d bytes",
+                     data_shm.name, count, len(data))
+        return cls(data_shm, index_shm, owner=True)
+
+    @classmethod
+    def attach(cls, data_name: str, index_name: str) -> "SharedWordlist":
+        """Attach to blocks another process created, without re-reading
+        the file."""
+        return cls(shared_memory.SharedMemory(name=data_name),
+                   shared_memory.SharedMemory(name=index_name),
+                   owner=False)
+
+    @property
+    def names(self):
+        """(data, index) block names for workers to attach by."""
+        return self._data_shm.name, self._index_shm.name
+
+    def get_line(self, i: int) -> bytes:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return bytes(self._data_shm.buf[self._offsets[i]:self._offsets[i + 1]]).strip()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[bytes]:
+        for i in range(self._count):
+            yield self.get_line(i)
+
+    def close(self):
+        """Detach; the owner also unlinks the blocks."""
+        self._data_shm.close()
+        self._index_shm.close()
+        if self._owner:
+            self._data_shm.unlink()
+            self._index_shm.unlink()
@@ -0,0 +1,34 @@
+"""Shared fixtures for the scan-output tests."""
+import pytest
+
+from src.output.save_results import create_results
+
+TEST_CASES = [
+    {"name": "no_findings", "user_enum": False, "brute_force": False,
+     "usernames": [], "credentials": []},
+    {"name": "user_enum_only", "user_enum": True, "brute_force": False,
+     "usernames": ["admin"], "credentials": []},
+    {"name": "full_chain", "user_enum": True, "brute_force": True,
+     "usernames": ["admin", "editor"],
+     "credentials": [{"username": "admin", "password": "admin"}]},
+]
+
+
+@pytest.fixture(scope="session", params=TEST_CASES, ids=lambda c: c["name"])
+def scenario_results(request):
+    """(name, results) per scenario, built once for the whole session so
+    every test validating a scenario shares one create_results call."""
+    case = request.param
+    results = create_results("http://localhost/wordpress",
+                             case["user_enum"], case["brute_force"],
+                             case["usernames"], case["credentials"])
+    return case["name"], results
+
+
+@pytest.fixture(scope="session")
+def workdir(tmp_path_factory):
+    """One session-scoped scratch directory shared by the file-writing
+    tests; each test uses a distinct filename (request.node.name), so
+    per-test mkdir/teardown syscalls disappear from parametrized
+    sweeps."""
+    return tmp_path_factory.mktemp("scan-output")
@@ -0,0 +1,78 @@
+"""Tests for the wordlist loaders."""
+import io
+import tracemalloc
+
+from src.utils import file_utils
+
+
+def test_load_usernames(workdir):
+    wordlist = workdir / "usernames.txt"
+    wordlist.write_text("admin\nuser\n")
+    assert file_utils.load_usernames(str(wordlist)) == ["admin", "user"]
+    assert list(file_utils.iter_usernames(str(wordlist))) == ["admin", "user"]
+
+
+def test_load_usernames_from_stream():
+    # No filesystem round trip at all: the loader duck-types on read()
+    assert file_utils.load_usernames(io.StringIO("admin\nuser\n")) == ["admin", "user"]
+    assert file_utils.load_usernames(io.BytesIO(b"admin\nuser\n")) == ["admin", "user"]
+
+
+def test_load_usernames_skips_blank_lines(workdir):
+    wordlist = workdir / "usernames_blank.txt"
+    wordlist.write_text("admin\n\n  \nuser")
+    assert file_utils.load_usernames(str(wordlist)) == ["admin", "user"]
+
+
+def test_index_wordlist(workdir):
+    wordlist = workdir / "usernames_indexed.txt"
+    wordlist.write_text("admin\nuser\n")
+    mm, newlines = file_utils.index_wordlist(str(wordlist))
+    # A trailing newline must not index a phantom empty final line
+    assert len(newlines) - 1 == 2
+    assert [file_utils.get_line(mm, newlines, i) for i in range(2)] == ["admin", "user"]
+    mm.close()
+
+    unterminated = workdir / "usernames_unterminated.txt"
+    unterminated.write_text("admin\nuser")
+    mm, newlines = file_utils.index_wordlist(str(unterminated))
+    assert len(newlines) - 1 == 2
+    assert file_utils.get_line(mm, newlines, 1) == "user"
+    mm.close()
+
+    empty = workdir / "empty_indexed.txt"
+    empty.write_text("")
+    mm, newlines = file_utils.index_wordlist(str(empty))
+    assert mm is None and len(newlines) - 1 == 0
+
+
+def test_load_usernames_chunked(workdir):
+    wordlist = workdir / "usernames_chunked.txt"
+    wordlist.write_text("a\nb\nc\n")
+    chunks = list(file_utils.load_usernames_chunked(str(wordlist), chunk_size=2))
+    assert chunks == [["a", "b"], ["c"]]
+
+
+def test_mmap_usernames(workdir):
+    wordlist = workdir / "usernames_mmap.txt"
+    wordlist.write_text("admin\n\nuser \nguest")
+    assert list(file_utils.mmap_usernames(str(wordlist))) == ["admin", "user", "guest"]
+    empty = workdir / "empty.txt"
+    empty.write_text("")
+    assert list(file_utils.mmap_usernames(str(empty))) == []
+
+
+def test_mmap_usernames_memory_bounded(workdir):
+    """Iterating a large list via mmap must not scale memory with the
+    file: one million lines (~9 MB) should stay well under 2 MB peak."""
+    wordlist = workdir / "big.txt"
+    with open(wordlist, "w") as f:
+        f.writelines(f"user{i}\n" for i in range(1_000_000))
+
+    tracemalloc.start()
+    count = sum(1 for _ in file_utils.mmap_usernames(str(wordlist)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert count == 1_000_000
+    assert peak < 2 * 1024 * 1024, peak
@@ -0,0 +1,157 @@
+"""Tests for the shape of the results document."""
+import io
+import itertools
+import json
+import logging
+import os
+import sys
+
+from src.output.save_results import (VULN_ORDER, create_results,
+                                     dumps_json, write_results_stream)
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+logger = logging.getLogger(__name__)
+
+# The document contract, stated once as a schema. With fastjsonschema
+# installed it is compiled at import into a specialized validator
+# function; otherwise the hand-rolled walk below covers the same rules.
+_SCHEMA = {
+    "type": "object",
+    "required": ["target", "vulnerabilities"],
+    "properties": {
+        "target": {"type": "string"},
+        "vulnerabilities": {
+            "type": "array",
+            "minItems": 2,
+            "maxItems": 2,
+            # Array-form items: each record is validated against the
+            # schema at its VULN_ORDER position, enforcing the ordering
+            # contract instead of an order-agnostic oneOf
+            "items": [
+                    {
+                        "type": "object",
+                        "required": ["type", "detected", "vector", "confidence"],
+                        "properties": {
+                            "type": {"const": "User Enumeration"},
+                            "detected": {"type": "boolean"},
+                            "vector": {"type": "string"},
+                            "confidence": {"type": "string"}
+                        }
+                    },
+                    {
+                        "type": "object",
+                        "required": ["type", "detected", "vector",
+                                     "usernames_tested", "credentials_found",
+                                     "confidence"],
+                        "properties": {
+                            "type": {"const": "Brute-force Login"},
+                            "detected": {"type": "boolean"},
+                            "vector": {"type": "string"},
+                            "usernames_tested": {"type": "array"},
+                            "credentials_found": {"type": "array"},
+                            "confidence": {"type": "string"}
+                        }
+                    }
+            ]
+        }
+    }
+}
+
+_VALIDATE = fastjsonschema.compile(_SCHEMA) if fastjsonschema is not None else None
+
+
+def _verify_one(results) -> bool:
+    if _VALIDATE is not None:
+        try:
+            _VALIDATE(results)
+            return True
+        except fastjsonschema.JsonSchemaException as e:
+            logger.debug("schema validation failed: %s", e)
+            return False
+
+    # Fallback walk, equivalent to _SCHEMA. Structural patterns resolve
+    # presence plus type per field in one MATCH_MAPPING/MATCH_CLASS
+    # sequence instead of a dict lookup followed by a type check, and
+    # the [v1, v2] pattern folds in the exactly-two-records rule.
+    match results:
+        case {"target": str(), "vulnerabilities": [v1, v2]}:
+            pass
+        case _:
+            logger.debug("bad top-level structure")
+            return False
+
+    # VULN_ORDER is a contract of create_results, so each record is
+    # checked positionally — no by-type scan or index at all
+    match v1:
+        case {"type": "User Enumeration", "detected": bool(),
+              "vector": str(), "confidence": str()}:
+            pass
+        case _:
+            logger.debug("bad user enumeration record")
+            return False
+    match v2:
+        case {"type": "Brute-force Login", "detected": bool(),
+              "vector": str(), "usernames_tested": list(),
+              "credentials_found": list(), "confidence": str()}:
+            pass
+        case _:
+            logger.debug("bad brute-force login record")
+            return False
+    return True
+
+
+def verify_output_format_batch(results_iter):
+    """Validate many result documents against the contract in one pass.
+
+    The schema is compiled once at import, so the batch form is a plain
+    map of that closure over the iterator; filterfalse keeps the loop in
+    C and returns only the failing documents.
+    """
+    return list(itertools.filterfalse(_verify_one, results_iter))
+
+
+def verify_output_format(results) -> bool:
+    """True when results matches the documented scan output contract."""
+    return not verify_output_format_batch((results,))
+
+
+def test_output_format(scenario_results):
+    name, results = scenario_results
+    # Scenario dumps are for human debugging only; CI skips the
+    # serialization entirely, and when requested it goes through the
+    # orjson-preferring encoder rather than stdlib json. The scenario
+    # name is not re-printed — the parametrize id on the node already
+    # carries it, so the hot path does zero string interpolation.
+    if os.environ.get("VERBOSE_TESTS"):
+        sys.stdout.buffer.write(dumps_json(results))
+        sys.stdout.write("\n")
+    assert verify_output_format(results), name
+
+
+def test_output_format_rejects_malformed():
+    results = create_results("http://localhost/wordpress", True, True,
+                             ["admin"], [])
+    assert verify_output_format(results)
+    good = create_results("http://localhost/wordpress", False, False, [], [])
+    del results["vulnerabilities"][1]["credentials_found"]
+    assert not verify_output_format(results)
+    assert not verify_output_format({"target": "http://x"})
+    # The batch form returns exactly the failing documents
+    assert verify_output_format_batch([good, results]) == [results]
+
+
+def test_vulnerability_order(scenario_results):
+    """Every path that produces a results document emits records in
+    VULN_ORDER, the positional contract consumers rely on."""
+    _, results = scenario_results
+    assert [v["type"] for v in results["vulnerabilities"]] == list(VULN_ORDER)
+
+    buf = io.BytesIO()
+    write_results_stream(buf, "http://localhost/wordpress", True, True,
+                         ["admin"], [])
+    streamed = json.loads(buf.getvalue())
+    assert [v["type"] for v in streamed["vulnerabilities"]] == list(VULN_ORDER)
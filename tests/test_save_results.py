@@ -0,0 +1,105 @@
+"""Tests for writing and reloading the results file."""
+import json
+import os
+import tracemalloc
+
+import pytest
+
+from src.output import save_results as save_results_module
+from src.output.save_results import (create_results, save_results,
+                                     save_results_ndjson)
+
+
+@pytest.fixture
+def results():
+    return create_results("http://localhost/wordpress", True, True,
+                          ["admin"], [{"username": "admin", "password": "admin"}])
+
+
+def _load_ndjson(path):
+    """Reassemble a results dict from NDJSON, one record per line."""
+    with open(path) as f:
+        results = json.loads(f.readline())
+        results["vulnerabilities"] = [json.loads(line) for line in f]
+    return results
+
+
+@pytest.mark.parametrize("mode", ["json", "ndjson"])
+def test_save_and_load_results(results, workdir, request, mode):
+    out = workdir / "results" / f"{request.node.name}.json"
+    if mode == "ndjson":
+        save_results_ndjson(results, str(out))
+        assert _load_ndjson(out) == results
+    else:
+        save_results(results, str(out))
+        with open(out) as f:
+            assert json.load(f) == results
+
+
+def test_save_results_streaming(results, workdir, request, monkeypatch):
+    """The stdlib path must stream through json.dump — never build the
+    document as an intermediate string with json.dumps."""
+    monkeypatch.setattr(save_results_module, "orjson", None)
+
+    def boom(*args, **kwargs):
+        raise AssertionError("save_results must not materialize via json.dumps")
+
+    monkeypatch.setattr(json, "dumps", boom)
+    out = workdir / f"{request.node.name}.json"
+    save_results(results, str(out))
+    with open(out) as f:
+        assert json.load(f) == results
+
+
+@pytest.mark.parametrize("entries", [10_000, 100_000])
+def test_load_results_memory_bounded(workdir, request, entries):
+    """Loading a large results file must not hold redundant copies.
+
+    The parsed object tree for this document measures ~4.6x the
+    pretty-printed file size on CPython 3.11, so the bound of 5.5x
+    leaves working headroom while still failing if a load-path change
+    starts keeping an extra full-text copy (+1x) alive at peak.
+    """
+    results = create_results(
+        "http://localhost/wordpress", True, True,
+        [f"user{i}" for i in range(entries)],
+        [{"username": f"user{i}", "password": f"pass{i}"} for i in range(entries)])
+    out = workdir / f"{request.node.name}.json"
+    save_results(results, str(out))
+    file_size = os.path.getsize(out)
+
+    tracemalloc.start()
+    with open(out) as f:
+        loaded = json.load(f)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert loaded["target"] == results["target"]
+    assert peak < 5.5 * file_size, f"peak {peak} vs file {file_size}"
+
+
+def test_load_ndjson_memory_bounded(workdir, request):
+    """NDJSON load peaks at roughly the largest record, not the file.
+
+    The document contract keeps the vulnerability count at two, so the
+    streaming win is demonstrated on a synthetic many-record document:
+    line-at-a-time parsing never holds the whole tree, and the working
+    set during the loop stays well under the file size.
+    """
+    results = {"target": "http://localhost/wordpress",
+               "vulnerabilities": [
+                   {"type": "probe", "detected": False, "vector": f"/p{i}"}
+                   for i in range(50_000)]}
+    out = workdir / f"{request.node.name}.json"
+    save_results_ndjson(results, str(out))
+    file_size = os.path.getsize(out)
+
+    tracemalloc.start()
+    with open(out) as f:
+        f.readline()
+        detected = sum(json.loads(line)["detected"] for line in f)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert detected == 0
+    assert peak < 0.1 * file_size, f"peak {peak} vs file {file_size}"